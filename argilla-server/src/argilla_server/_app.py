@@ -38,7 +38,7 @@ from argilla_server.contexts import accounts
 from argilla_server.database import get_async_db
 from argilla_server.logging import configure_logging
 from argilla_server.models import User, Workspace
-from argilla_server.search_engine import get_search_engine
+from argilla_server.search_engine import get_search_engine, shared_search_engine
 from argilla_server.settings import settings
 from argilla_server.static_rewrite import RewriteStaticFiles
 from argilla_server.jobs.queues import REDIS_CONNECTION
@@ -55,7 +55,8 @@ async def app_lifespan(app: FastAPI):
     configure_redis()
     track_server_startup()
 
-    yield
+    async with shared_search_engine():
+        yield
 
 
 def create_server_app() -> FastAPI:
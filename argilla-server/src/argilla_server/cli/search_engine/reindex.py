@@ -12,6 +12,7 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 import asyncio
+from collections import deque
 from typing import AsyncGenerator, Optional
 from uuid import UUID
 
@@ -30,6 +31,7 @@ from argilla_server.search_engine import SearchEngine, get_search_engine
 
 class Reindexer:
     YIELD_PER = 100
+    MAX_CONCURRENT_INDEX_REQUESTS = 4
 
     @classmethod
     async def reindex_dataset(cls, db: AsyncSession, search_engine: SearchEngine, dataset_id: UUID) -> Dataset:
@@ -87,12 +89,30 @@ class Reindexer:
             .execution_options(yield_per=cls.YIELD_PER)
         )
 
-        async for records_partition in stream.partitions():
-            records = [record for (record,) in records_partition]
+        # Partitions are indexed concurrently so bulk requests overlap with fetching the next partitions.
+        # Records are yielded in the same order once indexed.
+        index_tasks = deque()
+        try:
+            async for records_partition in stream.partitions():
+                records = [record for (record,) in records_partition]
 
-            await search_engine.index_records(dataset, records)
+                index_tasks.append(asyncio.create_task(cls._index_records(search_engine, dataset, records)))
+                if len(index_tasks) >= cls.MAX_CONCURRENT_INDEX_REQUESTS:
+                    yield await index_tasks.popleft()
 
-            yield records
+            while index_tasks:
+                yield await index_tasks.popleft()
+        finally:
+            for index_task in index_tasks:
+                index_task.cancel()
+
+            await asyncio.gather(*index_tasks, return_exceptions=True)
+
+    @staticmethod
+    async def _index_records(search_engine: SearchEngine, dataset: Dataset, records: list[Record]) -> list[Record]:
+        await search_engine.index_records(dataset, records)
+
+        return records
 
     @classmethod
     async def count_datasets(cls, db: AsyncSession) -> int:
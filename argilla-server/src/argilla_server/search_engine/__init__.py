@@ -12,7 +12,8 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from typing import AsyncGenerator
+from contextlib import asynccontextmanager
+from typing import AsyncGenerator, Optional
 
 from ..settings import settings
 from .base import *  # noqa
@@ -21,6 +22,29 @@ from .elasticsearch import ElasticSearchEngine
 from .opensearch import OpenSearchEngine
 
 
+_shared_search_engine: Optional[SearchEngine] = None
+
+
+@asynccontextmanager
+async def shared_search_engine() -> AsyncGenerator[SearchEngine, None]:
+    """Keeps a search engine instance open to be reused by `get_search_engine` while the context is active.
+
+    Reusing the same instance keeps its client connections alive instead of opening new ones for every request.
+    """
+    global _shared_search_engine
+
+    async with SearchEngine.get_by_name(settings.search_engine) as engine:
+        _shared_search_engine = engine
+        try:
+            yield engine
+        finally:
+            _shared_search_engine = None
+
+
 async def get_search_engine() -> AsyncGenerator[SearchEngine, None]:
+    if _shared_search_engine is not None:
+        yield _shared_search_engine
+        return
+
     async with SearchEngine.get_by_name(settings.search_engine) as engine:
         yield engine
@@ -14,7 +14,7 @@
 
 import dataclasses
 from abc import abstractmethod
-from typing import Any, Dict, Iterable, List, Optional, Union
+from typing import Any, Dict, Iterable, List, Optional, Set, Union
 from uuid import UUID
 
 from elasticsearch8 import AsyncElasticsearch
@@ -81,6 +81,7 @@ def es_bool_query(
     must: Optional[Any] = None,
     must_not: Optional[Any] = None,
     should: Optional[List[dict]] = None,
+    filter: Optional[Any] = None,
     minimum_should_match: Optional[Union[int, str]] = None,
 ) -> Dict[str, Any]:
     bool_query = {}
@@ -91,6 +92,8 @@ def es_bool_query(
         bool_query["should"] = should
     if must_not:
         bool_query["must_not"] = must_not
+    if filter:
+        bool_query["filter"] = filter
 
     if minimum_should_match:
         bool_query["minimum_should_match"] = minimum_should_match
@@ -295,17 +298,19 @@ class BaseElasticAndOpenSearchEngine(SearchEngine):
 
     async def index_records(self, dataset: Dataset, records: Iterable[Record]):
         index_name = es_index_name_for_dataset(dataset)
+        metadata_property_names = {metadata_property.name for metadata_property in dataset.metadata_properties}
 
-        bulk_actions = [
+        # Actions are generated lazily so documents are built chunk by chunk while the bulk request is being sent
+        bulk_actions = (
             {
                 # If document exist, we update source with latest version
                 "_op_type": "index",  # TODO: Review and maybe change to partial update
                 "_id": record.id,
                 "_index": index_name,
-                **self._map_record_to_es_document(record),
+                **self._map_record_to_es_document(record, metadata_property_names),
             }
             for record in records
-        ]
+        )
 
         await self._bulk_op_request(bulk_actions)
 
@@ -316,7 +321,7 @@ class BaseElasticAndOpenSearchEngine(SearchEngine):
     async def delete_records(self, dataset: Dataset, records: Iterable[Record]):
         index_name = es_index_name_for_dataset(dataset)
 
-        bulk_actions = [{"_op_type": "delete", "_id": record.id, "_index": index_name} for record in records]
+        bulk_actions = ({"_op_type": "delete", "_id": record.id, "_index": index_name} for record in records)
 
         await self._bulk_op_request(bulk_actions)
 
@@ -403,13 +408,20 @@ class BaseElasticAndOpenSearchEngine(SearchEngine):
         # See https://www.elastic.co/guide/en/elasticsearch/reference/current/search-search.html
         index = es_index_name_for_dataset(dataset)
 
-        text_query = self._build_text_query(dataset, text=query)
-        bool_query: Dict[str, Any] = {"must": [text_query]}
+        if query is None:
+            # Without a text query there is nothing to score, so filters are applied through a `constant_score`
+            # query. This skips scoring (every hit gets a score of 1.0, as with `match_all`) and lets the engine
+            # cache the filter results.
+            es_query = (
+                {"constant_score": {"filter": self.build_elasticsearch_filter(filter)}} if filter else {"match_all": {}}
+            )
+        else:
+            bool_query: Dict[str, Any] = {"must": [self._build_text_query(dataset, text=query)]}
 
-        if filter:
-            bool_query["filter"] = self.build_elasticsearch_filter(filter)
+            if filter:
+                bool_query["filter"] = self.build_elasticsearch_filter(filter)
 
-        es_query = {"bool": bool_query}
+            es_query = {"bool": bool_query}
 
         if user_id:
             # See https://www.elastic.co/guide/en/elasticsearch/reference/current/query-dsl-function-score-query.html#function-random
@@ -470,9 +482,10 @@ class BaseElasticAndOpenSearchEngine(SearchEngine):
             k=max_results,
             excluded_id=record_id,
             query_filters=query_filters,
+            min_score=threshold,
         )
 
-        return self._process_search_response(response, threshold)
+        return self._process_search_response(response)
 
     async def compute_metrics_for(self, metadata_property: MetadataProperty) -> MetadataMetrics:
         index_name = es_index_name_for_dataset(metadata_property.dataset)
@@ -485,8 +498,19 @@ class BaseElasticAndOpenSearchEngine(SearchEngine):
 
     def build_elasticsearch_filter(self, filter: Filter) -> Dict[str, Any]:
         if isinstance(filter, AndFilter):
-            filters = [self.build_elasticsearch_filter(f) for f in filter.filters]
-            return es_bool_query(must=filters)
+            filters = []
+            for and_filter in filter.filters:
+                es_filter = self.build_elasticsearch_filter(and_filter)
+                # Nested `AND` filters are merged into the parent clauses instead of adding a new bool level
+                if list(es_filter.get("bool", {})) == ["filter"]:
+                    filters.extend(es_filter["bool"]["filter"])
+                else:
+                    filters.append(es_filter)
+
+            if len(filters) == 1:
+                return filters[0]
+
+            return es_bool_query(filter=filters)
 
         if isinstance(filter.scope, ResponseFilterScope):
             return self._response_filter_to_es_filter(filter)
@@ -527,9 +551,9 @@ class BaseElasticAndOpenSearchEngine(SearchEngine):
 
     @staticmethod
     def _inverse_vector(vector_value: List[float]) -> List[float]:
-        return [vector_value[i] * -1 for i in range(0, len(vector_value))]
+        return [-value for value in vector_value]
 
-    def _map_record_to_es_document(self, record: Record) -> Dict[str, Any]:
+    def _map_record_to_es_document(self, record: Record, metadata_property_names: Set[str]) -> Dict[str, Any]:
         dataset = record.dataset
 
         document = {
@@ -542,7 +566,7 @@ class BaseElasticAndOpenSearchEngine(SearchEngine):
         }
 
         if record.metadata_:
-            document["metadata"] = self._map_record_metadata_to_es(record.metadata_, dataset.metadata_properties)
+            document["metadata"] = self._map_record_metadata_to_es(record.metadata_, metadata_property_names)
         if record.responses:
             document["responses"] = self._map_record_responses_to_es(record.responses)
         if record.suggestions:
@@ -569,17 +593,12 @@ class BaseElasticAndOpenSearchEngine(SearchEngine):
         return {es_path_for_vector_settings(vector.vector_settings): vector.value for vector in vectors}
 
     @staticmethod
-    def _map_record_metadata_to_es(
-        metadata: Dict[str, Any], metadata_properties: List[MetadataProperty]
-    ) -> Dict[str, Any]:
-        search_engine_metadata = {}
-
-        for metadata_property in metadata_properties:
-            value = metadata.get(metadata_property.name)
-            if value is not None:
-                search_engine_metadata[str(metadata_property.name)] = value
-
-        return search_engine_metadata
+    def _map_record_metadata_to_es(metadata: Dict[str, Any], metadata_property_names: Set[str]) -> Dict[str, Any]:
+        return {
+            str(name): value
+            for name, value in metadata.items()
+            if name in metadata_property_names and value is not None
+        }
 
     def _map_record_responses_to_es(self, responses: List[Response]) -> List[dict]:
         return [self._map_record_response_to_es(response) for response in responses]
@@ -590,7 +609,10 @@ class BaseElasticAndOpenSearchEngine(SearchEngine):
         field_name = es_field_for_metadata_property(metadata_property)
         query = query or {"match_all": {}}
 
-        stats = await self.__stats_aggregation(index_name, field_name, query)
+        aggregations = await self.__aggregations_request(
+            index_name, query=query, aggregations={"numeric_stats": self.__stats_aggregation(field_name)}
+        )
+        stats = aggregations["numeric_stats"]
 
         metrics_class = (
             IntegerMetadataMetrics if metadata_property.type == MetadataPropertyType.integer else FloatMetadataMetrics
@@ -604,13 +626,23 @@ class BaseElasticAndOpenSearchEngine(SearchEngine):
         field_name = es_field_for_metadata_property(metadata_property)
         query = query or {"match_all": {}}
 
-        total_terms = await self.__value_count_aggregation(index_name, field_name=field_name, query=query)
+        # Values count and terms are requested together to avoid an extra round-trip to the search engine
+        aggregations = await self.__aggregations_request(
+            index_name,
+            query=query,
+            aggregations={
+                "count_values": self.__value_count_aggregation(field_name),
+                "terms_agg": self.__terms_aggregation(field_name),
+            },
+        )
+
+        total_terms = aggregations["count_values"]["value"]
         if total_terms == 0:
             return TermsMetadataMetrics(total=total_terms)
 
-        terms_buckets = await self.__terms_aggregation(index_name, field_name=field_name, query=query, size=total_terms)
         terms_values = [
-            TermsMetadataMetrics.TermCount(term=bucket["key"], count=bucket["doc_count"]) for bucket in terms_buckets
+            TermsMetadataMetrics.TermCount(term=bucket["key"], count=bucket["doc_count"])
+            for bucket in aggregations["terms_agg"]["buckets"]
         ]
         return TermsMetadataMetrics(total=total_terms, values=terms_values)
 
@@ -638,12 +670,9 @@ class BaseElasticAndOpenSearchEngine(SearchEngine):
         }
 
     @staticmethod
-    def _process_search_response(response: dict, score_threshold: Optional[float] = None) -> SearchResponses:
+    def _process_search_response(response: dict) -> SearchResponses:
         hits = response["hits"]["hits"]
 
-        if score_threshold is not None:
-            hits = filter(lambda hit: hit["_score"] >= score_threshold, hits)
-
         items = [SearchResponseItem(record_id=UUID(hit["_id"]), score=hit["_score"]) for hit in hits]
         total = response["hits"]["total"]["value"]
 
@@ -823,16 +852,19 @@ class BaseElasticAndOpenSearchEngine(SearchEngine):
 
     @staticmethod
     def _map_record_response_to_es(response: Response) -> Dict[str, Any]:
-        return {
+        es_response = {
             "id": response.id,
             "status": response.status,
             "user_id": response.user_id,
-            **{
-                es_path_for_question_response(question): value.get("value")
-                for question, value in response.values.items()
-            },
         }
 
+        # Discarded responses can be stored without values
+        if response.values:
+            for question, value in response.values.items():
+                es_response[es_path_for_question_response(question)] = value.get("value")
+
+        return es_response
+
     @classmethod
     def _map_record_fields_to_es(cls, fields: dict, dataset_fields: List[Field]) -> dict:
         for field in dataset_fields:
@@ -845,30 +877,21 @@ class BaseElasticAndOpenSearchEngine(SearchEngine):
 
         return fields
 
-    async def __terms_aggregation(self, index_name: str, field_name: str, query: dict, size: int) -> List[dict]:
-        aggregation_name = "terms_agg"
+    async def __aggregations_request(self, index_name: str, query: dict, aggregations: dict) -> dict:
+        response = await self._index_search_request(index_name, query=query, aggregations=aggregations, size=0)
+        return response["aggregations"]
 
-        terms_agg = {aggregation_name: {"terms": {"field": field_name, "size": min(size, self.max_terms_size)}}}
+    def __terms_aggregation(self, field_name: str) -> dict:
+        return {"terms": {"field": field_name, "size": self.max_terms_size}}
 
-        response = await self._index_search_request(index_name, query=query, aggregations=terms_agg, size=0)
-        return response["aggregations"][aggregation_name]["buckets"]
-
-    async def __value_count_aggregation(self, index_name: str, field_name: str, query: dict) -> int:
-        aggregation_name = "count_values"
-
-        value_count_agg = {aggregation_name: {"value_count": {"field": field_name}}}
-
-        response = await self._index_search_request(index_name, query=query, aggregations=value_count_agg, size=0)
-        return response["aggregations"][aggregation_name]["value"]
+    @staticmethod
+    def __value_count_aggregation(field_name: str) -> dict:
+        return {"value_count": {"field": field_name}}
 
-    async def __stats_aggregation(self, index_name: str, field_name: str, query: dict) -> dict:
+    @staticmethod
+    def __stats_aggregation(field_name: str) -> dict:
         # See https://www.elastic.co/guide/en/elasticsearch/reference/current/search-aggregations-metrics-stats-aggregation.html
-        aggregation_name = "numeric_stats"
-
-        stats_agg = {aggregation_name: {"stats": {"field": field_name}}}
-
-        response = await self._index_search_request(index_name, query=query, aggregations=stats_agg, size=0)
-        return response["aggregations"][aggregation_name]
+        return {"stats": {"field": field_name}}
 
     @abstractmethod
     def _mapping_for_vector_settings(self, vector_settings: VectorSettings) -> dict:
@@ -884,10 +907,12 @@ class BaseElasticAndOpenSearchEngine(SearchEngine):
         k: int,
         excluded_id: Optional[UUID] = None,
         query_filters: Optional[List[dict]] = None,
+        min_score: Optional[float] = None,
     ) -> dict:
         """
         Applies the similarity search request based on a vector configuration, a vector value,
-        the `k` number of results to retrieve and an optional filter configuration to apply
+        the `k` number of results to retrieve, an optional filter configuration and an optional
+        minimum score for the returned hits
         """
         pass
 
@@ -930,7 +955,7 @@ class BaseElasticAndOpenSearchEngine(SearchEngine):
         pass
 
     @abstractmethod
-    async def _bulk_op_request(self, actions: List[Dict[str, Any]]):
+    async def _bulk_op_request(self, actions: Iterable[Dict[str, Any]]):
         """Executes request for bulk operations"""
         pass
 
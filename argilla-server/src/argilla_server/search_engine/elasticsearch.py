@@ -13,10 +13,12 @@
 #  limitations under the License.
 
 import dataclasses
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 from uuid import UUID
 
+import orjson
 from elasticsearch8 import AsyncElasticsearch, helpers
+from elasticsearch8.serializer import JsonSerializer
 
 from argilla_server.constants import SEARCH_ENGINE_ELASTICSEARCH
 from argilla_server.models import VectorSettings
@@ -30,6 +32,19 @@ from argilla_server.search_engine.commons import (
 from argilla_server.settings import settings
 
 
+class OrjsonSerializer(JsonSerializer):
+    """JSON serializer using `orjson` to encode request bodies and decode responses"""
+
+    def json_dumps(self, data: Any) -> bytes:
+        return orjson.dumps(data, default=self.default)
+
+    def json_loads(self, data: bytes) -> Any:
+        # Same as the parent class: some responses are sent with a JSON content type but without data
+        if data == b"":
+            return None
+        return orjson.loads(data)
+
+
 def _compute_num_candidates_from_k(k: int) -> int:
     if k < 50:
         return 500
@@ -44,7 +59,7 @@ class ElasticSearchEngine(BaseElasticAndOpenSearchEngine):
     config: Dict[str, Any] = dataclasses.field(default_factory=dict)
 
     def __post_init__(self):
-        self.client = AsyncElasticsearch(**self.config)
+        self.client = AsyncElasticsearch(**{"serializer": OrjsonSerializer(), **self.config})
 
     @classmethod
     async def new_instance(cls) -> "ElasticSearchEngine":
@@ -52,6 +67,7 @@ class ElasticSearchEngine(BaseElasticAndOpenSearchEngine):
             hosts=settings.elasticsearch,
             verify_certs=settings.elasticsearch_ssl_verify,
             ca_certs=settings.elasticsearch_ca_path,
+            http_compress=settings.elasticsearch_http_compress,
             retry_on_timeout=True,
             max_retries=5,
         )
@@ -92,6 +108,7 @@ class ElasticSearchEngine(BaseElasticAndOpenSearchEngine):
         k: int,
         excluded_id: Optional[UUID] = None,
         query_filters: Optional[List[dict]] = None,
+        min_score: Optional[float] = None,
     ) -> dict:
         knn_query = {
             "field": es_field_for_vector_settings(vector_settings),
@@ -101,20 +118,21 @@ class ElasticSearchEngine(BaseElasticAndOpenSearchEngine):
         }
 
         if bool(excluded_id) or bool(query_filters):
-            minimum_should_match = None
             must_not_filters = None
 
             if excluded_id:
                 must_not_filters = [es_ids_query([str(excluded_id)])]
-            if query_filters:
-                minimum_should_match = len(query_filters)
 
-            bool_filter_query = es_bool_query(
-                should=query_filters, minimum_should_match=minimum_should_match, must_not=must_not_filters
-            )
+            knn_query["filter"] = es_bool_query(filter=query_filters, must_not=must_not_filters)
 
-            knn_query["filter"] = bool_filter_query
-        return await self.client.search(index=index, knn=knn_query, _source=False, track_total_hits=True, size=k)
+        return await self.client.search(
+            index=index,
+            knn=knn_query,
+            min_score=min_score,
+            _source=False,
+            track_total_hits=True,
+            size=k,
+        )
 
     async def _create_index_request(self, index_name: str, mappings: dict, settings: dict) -> None:
         await self.client.indices.create(index=index_name, settings=settings, mappings=mappings)
@@ -152,7 +170,7 @@ class ElasticSearchEngine(BaseElasticAndOpenSearchEngine):
     async def _index_exists_request(self, index_name: str) -> bool:
         return await self.client.indices.exists(index=index_name)
 
-    async def _bulk_op_request(self, actions: List[Dict[str, Any]]):
+    async def _bulk_op_request(self, actions: Iterable[Dict[str, Any]]):
         # https://www.elastic.co/guide/en/elasticsearch/reference/current/indices-refresh.html#refresh-api-desc
         _, errors = await helpers.async_bulk(client=self.client, actions=actions, raise_on_error=False, refresh=True)
         if errors:
@@ -13,10 +13,13 @@
 #  limitations under the License.
 
 import dataclasses
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 from uuid import UUID
 
+import orjson
 from opensearchpy import AsyncOpenSearch, helpers
+from opensearchpy.exceptions import SerializationError
+from opensearchpy.serializer import JSONSerializer
 
 from argilla_server.constants import SEARCH_ENGINE_OPENSEARCH
 from argilla_server.models import VectorSettings
@@ -30,13 +33,33 @@ from argilla_server.search_engine.commons import (
 from argilla_server.settings import settings
 
 
+class OrjsonSerializer(JSONSerializer):
+    """JSON serializer using `orjson` to encode request bodies and decode responses"""
+
+    def loads(self, s):
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError as e:
+            raise SerializationError(s, e)
+
+    def dumps(self, data):
+        # don't serialize strings
+        if isinstance(data, str):
+            return data
+
+        try:
+            return orjson.dumps(data, default=self.default).decode("utf-8")
+        except orjson.JSONEncodeError as e:
+            raise SerializationError(data, e)
+
+
 @SearchEngine.register(engine_name=SEARCH_ENGINE_OPENSEARCH)
 @dataclasses.dataclass
 class OpenSearchEngine(BaseElasticAndOpenSearchEngine):
     config: Dict[str, Any] = dataclasses.field(default_factory=dict)
 
     def __post_init__(self):
-        self.client = AsyncOpenSearch(**self.config)
+        self.client = AsyncOpenSearch(**{"serializer": OrjsonSerializer(), **self.config})
 
     @classmethod
     async def new_instance(cls) -> "OpenSearchEngine":
@@ -44,6 +67,7 @@ class OpenSearchEngine(BaseElasticAndOpenSearchEngine):
             hosts=settings.elasticsearch,
             verify_certs=settings.elasticsearch_ssl_verify,
             ca_certs=settings.elasticsearch_ca_path,
+            http_compress=settings.elasticsearch_http_compress,
             retry_on_timeout=True,
             max_retries=5,
         )
@@ -89,6 +113,7 @@ class OpenSearchEngine(BaseElasticAndOpenSearchEngine):
         k: int,
         excluded_id: Optional[UUID] = None,
         query_filters: Optional[List[dict]] = None,
+        min_score: Optional[float] = None,
     ) -> dict:
         knn_query = {"vector": value, "k": k}
 
@@ -104,7 +129,10 @@ class OpenSearchEngine(BaseElasticAndOpenSearchEngine):
             # created for requested user (with exists query clauses). This is not happening with Elasticsearch.
             # The only way make it work is to use them as a post_filter.
             # See this issue for more details https://github.com/opensearch-project/k-NN/issues/1286
-            body["post_filter"] = es_bool_query(should=query_filters, minimum_should_match=len(query_filters))
+            body["post_filter"] = es_bool_query(filter=query_filters)
+
+        if min_score is not None:
+            body["min_score"] = min_score
 
         return await self.client.search(index=index, body=body, _source=False, track_total_hits=True, size=k)
 
@@ -149,7 +177,7 @@ class OpenSearchEngine(BaseElasticAndOpenSearchEngine):
     async def _index_exists_request(self, index_name: str) -> bool:
         return await self.client.indices.exists(index=index_name)
 
-    async def _bulk_op_request(self, actions: List[Dict[str, Any]]):
+    async def _bulk_op_request(self, actions: Iterable[Dict[str, Any]]):
         # https://www.elastic.co/guide/en/elasticsearch/reference/current/indices-refresh.html#refresh-api-desc
         _, errors = await helpers.async_bulk(client=self.client, actions=actions, raise_on_error=False, refresh=True)
         if errors:
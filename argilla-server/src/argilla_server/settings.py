@@ -96,6 +96,10 @@ class Settings(BaseSettings):
     elasticsearch: str = "http://localhost:9200"
     elasticsearch_ssl_verify: bool = True
     elasticsearch_ca_path: Optional[str] = None
+    elasticsearch_http_compress: bool = Field(
+        default=False,
+        description="If True, request and response bodies sent to the search engine will be gzip compressed",
+    )
     cors_origins: List[str] = ["*"]
 
     redis_url: str = "redis://localhost:6379/0"
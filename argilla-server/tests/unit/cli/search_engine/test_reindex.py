@@ -12,11 +12,19 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import math
 from uuid import uuid4
 
+import pytest
+from pytest_mock import MockerFixture
+from sqlalchemy.ext.asyncio import AsyncSession
 from typer import Typer
 from typer.testing import CliRunner
 
+from argilla_server.cli.search_engine.reindex import Reindexer
+from argilla_server.search_engine import SearchEngine
+from tests.factories import DatasetFactory, RecordFactory
+
 
 class TestCliServerSearchEngineReindex:
     # TODO: This test should create multiple datasets and records so they are reindexed.
@@ -32,3 +40,42 @@ class TestCliServerSearchEngineReindex:
         result = cli_runner.invoke(cli, f"search-engine reindex --dataset-id {uuid4()}")
 
         assert result.exit_code == 1
+
+
+@pytest.mark.asyncio
+class TestReindexer:
+    async def test_reindex_dataset_records(
+        self, db: AsyncSession, mock_search_engine: SearchEngine, mocker: MockerFixture
+    ):
+        mocker.patch.object(Reindexer, "YIELD_PER", 2)
+
+        dataset = await DatasetFactory.create()
+        records_count = Reindexer.YIELD_PER * Reindexer.MAX_CONCURRENT_INDEX_REQUESTS * 2 + 1
+        records = await RecordFactory.create_batch(records_count, dataset=dataset)
+
+        partitions = [
+            partition async for partition in Reindexer.reindex_dataset_records(db, mock_search_engine, dataset)
+        ]
+
+        assert len(partitions) == math.ceil(records_count / Reindexer.YIELD_PER)
+        assert partitions == [call.args[1] for call in mock_search_engine.index_records.await_args_list]
+        assert mock_search_engine.index_records.await_count == len(partitions)
+        assert {record.id for partition in partitions for record in partition} == {record.id for record in records}
+
+    async def test_reindex_dataset_records_with_index_error(
+        self, db: AsyncSession, mock_search_engine: SearchEngine, mocker: MockerFixture
+    ):
+        mocker.patch.object(Reindexer, "YIELD_PER", 2)
+        mock_search_engine.index_records.side_effect = [None, Exception("index error")] + [None] * 10
+
+        dataset = await DatasetFactory.create()
+        await RecordFactory.create_batch(
+            Reindexer.YIELD_PER * Reindexer.MAX_CONCURRENT_INDEX_REQUESTS * 2, dataset=dataset
+        )
+
+        partitions = []
+        with pytest.raises(Exception, match="index error"):
+            async for partition in Reindexer.reindex_dataset_records(db, mock_search_engine, dataset):
+                partitions.append(partition)
+
+        assert len(partitions) == 1
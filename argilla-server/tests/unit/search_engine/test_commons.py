@@ -24,6 +24,7 @@ from sqlalchemy.orm import Session
 from argilla_server.enums import (
     MetadataPropertyType,
     QuestionType,
+    ResponseStatus,
     ResponseStatusFilter,
     SimilarityOrder,
     RecordStatus,
@@ -785,6 +786,24 @@ class TestBaseElasticAndOpenSearchEngine:
                 ),
                 1,
             ),
+            (
+                AndFilter(
+                    filters=[
+                        AndFilter(
+                            filters=[
+                                TermsFilter(scope=MetadataFilterScope(metadata_property="label"), values=["negative"])
+                            ]
+                        ),
+                        AndFilter(
+                            filters=[
+                                RangeFilter(scope=MetadataFilterScope(metadata_property="textId"), ge=3, le=4),
+                                RangeFilter(scope=MetadataFilterScope(metadata_property="seq_float"), ge=0.0),
+                            ]
+                        ),
+                    ]
+                ),
+                1,
+            ),
         ],
     )
     async def test_search_with_metadata_filter(
@@ -799,6 +818,33 @@ class TestBaseElasticAndOpenSearchEngine:
         assert len(result.items) == expected_items
         assert result.total == expected_items
 
+    async def test_build_elasticsearch_filter_with_nested_and_filters(
+        self, search_engine: BaseElasticAndOpenSearchEngine
+    ):
+        es_filter = search_engine.build_elasticsearch_filter(
+            AndFilter(
+                filters=[
+                    AndFilter(
+                        filters=[
+                            TermsFilter(scope=MetadataFilterScope(metadata_property="label"), values=["negative"]),
+                            RangeFilter(scope=MetadataFilterScope(metadata_property="textId"), ge=3),
+                        ]
+                    ),
+                    AndFilter(filters=[RangeFilter(scope=MetadataFilterScope(metadata_property="seq_float"), le=1.0)]),
+                ]
+            )
+        )
+
+        assert es_filter == {
+            "bool": {
+                "filter": [
+                    {"terms": {"metadata.label": ["negative"]}},
+                    {"range": {"metadata.textId": {"gte": 3}}},
+                    {"range": {"metadata.seq_float": {"lte": 1.0}}},
+                ]
+            }
+        }
+
     async def test_search_with_no_query(
         self,
         search_engine: BaseElasticAndOpenSearchEngine,
@@ -812,6 +858,22 @@ class TestBaseElasticAndOpenSearchEngine:
         result_scores = set([item.score for item in result.items])
         assert result_scores == {1.0}
 
+    async def test_search_with_filter_and_no_query(
+        self,
+        search_engine: BaseElasticAndOpenSearchEngine,
+        opensearch: OpenSearch,
+        test_banking_sentiment_dataset: Dataset,
+    ):
+        result = await search_engine.search(
+            test_banking_sentiment_dataset,
+            filter=TermsFilter(scope=MetadataFilterScope(metadata_property="label"), values=["neutral"]),
+        )
+        assert len(result.items) == 4
+        assert result.total == 4
+
+        result_scores = set([item.score for item in result.items])
+        assert result_scores == {1.0}
+
     async def test_search_with_response_status_filter_does_not_affect_the_result_scores(
         self,
         search_engine: BaseElasticAndOpenSearchEngine,
@@ -1090,6 +1152,33 @@ class TestBaseElasticAndOpenSearchEngine:
             for record in records
         ]
 
+    async def test_index_records_with_undeclared_and_null_metadata(
+        self, search_engine: BaseElasticAndOpenSearchEngine, opensearch: OpenSearch
+    ):
+        metadata_properties = await TermsMetadataPropertyFactory.create_batch(2)
+
+        dataset = await DatasetFactory.create(metadata_properties=metadata_properties, questions=[])
+        record = await RecordFactory.create(
+            dataset=dataset,
+            metadata_={
+                metadata_properties[0].name: "Value for Metadata Property",
+                metadata_properties[1].name: None,
+                "undeclared": "Value for undeclared property",
+            },
+            responses=[],
+        )
+
+        await refresh_dataset(dataset)
+        await refresh_records([record])
+
+        await search_engine.create_index(dataset)
+        await search_engine.index_records(dataset, [record])
+
+        index_name = es_index_name_for_dataset(dataset)
+
+        es_docs = [hit["_source"] for hit in opensearch.search(index=index_name)["hits"]["hits"]]
+        assert es_docs[0]["metadata"] == {str(metadata_properties[0].name): "Value for Metadata Property"}
+
     async def test_index_records_with_vectors(
         self, search_engine: BaseElasticAndOpenSearchEngine, opensearch: OpenSearch
     ):
@@ -1206,6 +1295,27 @@ class TestBaseElasticAndOpenSearchEngine:
             "type": "nested",
         }
 
+    async def test_update_record_response_without_values(
+        self,
+        search_engine: BaseElasticAndOpenSearchEngine,
+        opensearch: OpenSearch,
+        test_banking_sentiment_dataset: Dataset,
+    ):
+        record = test_banking_sentiment_dataset.records[0]
+
+        response = await ResponseFactory.create(record=record, values=None, status=ResponseStatus.discarded)
+        record = await response.awaitable_attrs.record
+        await record.awaitable_attrs.dataset
+        await search_engine.update_record_response(response)
+
+        index_name = es_index_name_for_dataset(test_banking_sentiment_dataset)
+
+        results = opensearch.get(index=index_name, id=record.id)
+
+        assert results["_source"]["responses"] == [
+            {"id": str(response.id), "status": "discarded", "user_id": str(response.user_id)},
+        ]
+
     @pytest.mark.parametrize("annotators_size", [20, 200, 400])
     async def test_annotators_limits(
         self,
@@ -1444,6 +1554,61 @@ class TestBaseElasticAndOpenSearchEngine:
         assert responses.total == 1
         assert responses.items[0].record_id == selected_record.id
 
+    @pytest.mark.parametrize("threshold, expected_results", [(0.0, 5), (1.1, 0)])
+    async def test_similarity_search_by_vector_value_with_threshold(
+        self,
+        search_engine: BaseElasticAndOpenSearchEngine,
+        opensearch: OpenSearch,
+        test_banking_sentiment_dataset_with_vectors: Dataset,
+        threshold: float,
+        expected_results: int,
+    ):
+        selected_record = test_banking_sentiment_dataset_with_vectors.records[0]
+        selected_vector = selected_record.vectors[0]
+
+        responses = await search_engine.similarity_search(
+            dataset=test_banking_sentiment_dataset_with_vectors,
+            vector_settings=selected_vector.vector_settings,
+            value=selected_vector.value,
+            max_results=5,
+            threshold=threshold,
+        )
+
+        assert len(responses.items) == expected_results
+        assert all(item.score >= threshold for item in responses.items)
+
+    async def test_similarity_search_by_vector_value_with_threshold_between_scores(
+        self,
+        search_engine: BaseElasticAndOpenSearchEngine,
+        opensearch: OpenSearch,
+        test_banking_sentiment_dataset_with_vectors: Dataset,
+    ):
+        selected_record = test_banking_sentiment_dataset_with_vectors.records[0]
+        selected_vector = selected_record.vectors[0]
+
+        all_responses = await search_engine.similarity_search(
+            dataset=test_banking_sentiment_dataset_with_vectors,
+            vector_settings=selected_vector.vector_settings,
+            value=selected_vector.value,
+            max_results=5,
+        )
+
+        scores = [item.score for item in all_responses.items]
+        threshold = (max(scores) + min(scores)) / 2
+        expected_items = [item for item in all_responses.items if item.score >= threshold]
+        assert 0 < len(expected_items) < len(all_responses.items)
+
+        responses = await search_engine.similarity_search(
+            dataset=test_banking_sentiment_dataset_with_vectors,
+            vector_settings=selected_vector.vector_settings,
+            value=selected_vector.value,
+            max_results=5,
+            threshold=threshold,
+        )
+
+        assert [item.record_id for item in responses.items] == [item.record_id for item in expected_items]
+        assert responses.total == len(expected_items)
+
     async def test_similarity_search_by_vector_value_with_order(
         self,
         search_engine: BaseElasticAndOpenSearchEngine,
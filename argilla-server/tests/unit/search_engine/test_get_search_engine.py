@@ -0,0 +1,34 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import pytest
+
+from argilla_server.search_engine import get_search_engine, shared_search_engine
+
+
+@pytest.mark.asyncio
+class TestGetSearchEngine:
+    async def test_get_search_engine(self):
+        engines = [engine async for engine in get_search_engine()] + [engine async for engine in get_search_engine()]
+
+        assert len(engines) == 2
+        assert engines[0] is not engines[1]
+
+    async def test_get_search_engine_with_shared_search_engine(self):
+        async with shared_search_engine() as shared_engine:
+            async for engine in get_search_engine():
+                assert engine is shared_engine
+
+        async for engine in get_search_engine():
+            assert engine is not shared_engine
@@ -12,9 +12,14 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import uuid
+from datetime import datetime
+
 import pytest
+from argilla_server.enums import ResponseStatus
 from argilla_server.search_engine import OpenSearchEngine
 from argilla_server.search_engine.commons import es_index_name_for_dataset
+from argilla_server.search_engine.opensearch import OrjsonSerializer
 from argilla_server.settings import settings
 from opensearchpy import OpenSearch, RequestError
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -80,3 +85,22 @@ class TestOpenSearchEngine:
 
         with pytest.raises(RequestError, match="resource_already_exists_exception"):
             await search_engine.create_index(dataset)
+
+    async def test_client_serializer(self, opensearch_engine: OpenSearchEngine):
+        serializer = opensearch_engine.client.transport.serializer
+        assert isinstance(serializer, OrjsonSerializer)
+
+        document_id = uuid.uuid4()
+        document = {
+            "id": document_id,
+            "status": ResponseStatus.submitted,
+            "inserted_at": datetime(2024, 1, 1, 10, 30, 15, 123456),
+            "vector": [0.5, -1.25],
+        }
+
+        assert serializer.loads(serializer.dumps(document)) == {
+            "id": str(document_id),
+            "status": "submitted",
+            "inserted_at": "2024-01-01T10:30:15.123456",
+            "vector": [0.5, -1.25],
+        }
@@ -17,7 +17,7 @@ for the trainer that may be reused in different modules.
 """
 
 from collections import Counter
-from typing import Any, Dict, Iterator
+from typing import Any, Dict, Iterator, Optional
 
 from argilla_v1.client.models import Framework
 from argilla_v1.feedback import TrainingTask
@@ -130,13 +130,16 @@ def formatting_func_sentence_transformers(sample: dict):
             ]
 
 
+def _first_submitted_label(sample: dict, question: str) -> Optional[Any]:
+    # Returns the first submitted value, stopping at it instead of collecting every annotation
+    for annotation in sample[question]:
+        if annotation["status"] == "submitted" and annotation["value"] is not None:
+            return annotation["value"]
+
+
 def formatting_func_sentence_transformers_all_lists(sample: dict):
-    labels = [
-        annotation["value"]
-        for annotation in sample["question-3"]
-        if annotation["status"] == "submitted" and annotation["value"] is not None
-    ]
-    if labels:
+    label = _first_submitted_label(sample, "question-3")
+    if label is not None:
         # Force to pass always a list of values
         return [
             {"sentence-1": sample["text"], "sentence-2": sample["text"], "label": 1},
@@ -148,17 +151,13 @@ def formatting_func_sentence_transformers_all_lists(sample: dict):
 
 
 def formatting_func_sentence_transformers_case_1_b(sample):
-    labels = [
-        annotation["value"]
-        for annotation in sample["question-3"]
-        if annotation["status"] == "submitted" and annotation["value"] is not None
-    ]
-    if labels:
-        if labels[0] == "a":
+    label = _first_submitted_label(sample, "question-3")
+    if label is not None:
+        if label == "a":
             return None
-        elif labels[0] == "b":
+        elif label == "b":
             return {"sentence-1": sample["text"], "sentence-2": sample["text"], "label": 0.786}
-        elif labels[0] == "c":
+        elif label == "c":
             return [
                 {"sentence-1": sample["text"], "sentence-2": sample["text"], "label": 0.786},
                 {"sentence-1": sample["text"], "sentence-2": sample["text"], "label": 0.56},
@@ -166,54 +165,42 @@ def formatting_func_sentence_transformers_case_1_b(sample):
 
 
 def formatting_func_sentence_transformers_case_2(sample):
-    labels = [
-        annotation["value"]
-        for annotation in sample["question-3"]
-        if annotation["status"] == "submitted" and annotation["value"] is not None
-    ]
-    if labels:
+    label = _first_submitted_label(sample, "question-3")
+    if label is not None:
         # Three cases for the tests: None, one tuple and yielding multiple tuples
-        if labels[0] == "a":
+        if label == "a":
             return None
-        elif labels[0] == "b":
+        elif label == "b":
             return {"sentence-1": sample["text"], "sentence-2": sample["text"]}
-        elif labels[0] == "c":
+        elif label == "c":
             return [{"sentence-1": sample["text"], "sentence-2": sample["text"]}] * 2
 
 
 def formatting_func_sentence_transformers_case_3_a(sample):
-    labels = [
-        annotation["value"]
-        for annotation in sample["question-3"]
-        if annotation["status"] == "submitted" and annotation["value"] is not None
-    ]
-    if labels:
+    label = _first_submitted_label(sample, "question-3")
+    if label is not None:
         # Three cases for the tests: None, one tuple and yielding multiple tuples
-        if labels[0] == "a":
+        if label == "a":
             return None
-        elif labels[0] == "b":
+        elif label == "b":
             return {"sentence": sample["text"], "label": 1}
-        elif labels[0] == "c":
+        elif label == "c":
             return [{"sentence": sample["text"], "label": 1}, {"sentence": sample["text"], "label": 2}]
 
 
 def formatting_func_sentence_transformers_case_3_b(sample):
-    labels = [
-        annotation["value"]
-        for annotation in sample["question-3"]
-        if annotation["status"] == "submitted" and annotation["value"] is not None
-    ]
-    if labels:
-        if labels[0] == "a":
+    label = _first_submitted_label(sample, "question-3")
+    if label is not None:
+        if label == "a":
             return None
-        elif labels[0] == "b":
+        elif label == "b":
             return {
                 "sentence-1": sample["text"],
                 "sentence-2": sample["text"],
                 "sentence-3": sample["text"],
                 "label": 1,
             }
-        elif labels[0] == "c":
+        elif label == "c":
             return [
                 {"sentence-1": sample["text"], "sentence-2": sample["text"], "sentence-3": sample["text"], "label": 1},
                 {"sentence-1": sample["text"], "sentence-2": sample["text"], "sentence-3": sample["text"], "label": 2},
@@ -221,29 +208,21 @@ def formatting_func_sentence_transformers_case_3_b(sample):
 
 
 def formatting_func_sentence_transformers_case_4(sample):
-    labels = [
-        annotation["value"]
-        for annotation in sample["question-3"]
-        if annotation["status"] == "submitted" and annotation["value"] is not None
-    ]
-    if labels:
-        if labels[0] == "a":
+    label = _first_submitted_label(sample, "question-3")
+    if label is not None:
+        if label == "a":
             return None
-        elif labels[0] == "b":
+        elif label == "b":
             return {"sentence-1": sample["text"], "sentence-2": sample["text"], "sentence-3": sample["text"]}
-        elif labels[0] == "c":
+        elif label == "c":
             return [{"sentence-1": sample["text"], "sentence-2": sample["text"], "sentence-3": sample["text"]}] * 2
 
 
 def formatting_func_sentence_transformers_rating_question(sample: dict):
     # Formatting function to test the RatingQuestion
-    labels = [
-        annotation["value"]
-        for annotation in sample["question-2"]
-        if annotation["status"] == "submitted" and annotation["value"] is not None
-    ]
-    if labels:
-        return {"sentence-1": sample["text"], "sentence-2": sample["text"], "label": labels[0]}
+    rating = _first_submitted_label(sample, "question-2")
+    if rating is not None:
+        return {"sentence-1": sample["text"], "sentence-2": sample["text"], "label": rating}
 
 
 def model_card_pattern(framework: Framework, training_task: Any) -> str:
@@ -56,7 +56,26 @@ def formatting_func_errored(sample):
         return sample["text"], sample["text"], sample["text"]
 
 
-@pytest.mark.parametrize("cross_encoder,model_type", [(False, SentenceTransformer), (True, CrossEncoder)])
+def _build_feedback_dataset(
+    guidelines: str,
+    fields: List["AllowedFieldTypes"],
+    questions: List["AllowedQuestionTypes"],
+    records: List[FeedbackRecord],
+) -> FeedbackDataset:
+    dataset = FeedbackDataset(guidelines=guidelines, fields=fields, questions=questions)
+    dataset.add_records(records=records * 2)
+
+    return dataset
+
+
+def _build_training_task(dataset: FeedbackDataset, formatting_func: Callable) -> TrainingTask:
+    if formatting_func.__name__ == "formatting_func_sentence_transformers_rating_question":
+        label_strategy = RatingQuestionUnification(question=dataset.question_by_name("question-2"), strategy="majority")
+        return TrainingTask.for_sentence_similarity(formatting_func=formatting_func, label_strategy=label_strategy)
+
+    return TrainingTask.for_sentence_similarity(formatting_func=formatting_func)
+
+
 @pytest.mark.parametrize(
     "formatting_func",
     [
@@ -68,6 +87,7 @@ def formatting_func_errored(sample):
         formatting_func_sentence_transformers_case_4,
         formatting_func_sentence_transformers_rating_question,
     ],
+    ids=lambda formatting_func: formatting_func.__name__,
 )
 @pytest.mark.usefixtures(
     "feedback_dataset_guidelines",
@@ -76,26 +96,16 @@ def formatting_func_errored(sample):
     "feedback_dataset_records",
 )
 def test_prepare_for_training_sentence_transformers(
-    cross_encoder: bool,
-    model_type: Union[SentenceTransformer, CrossEncoder],
     formatting_func: Callable,
     feedback_dataset_guidelines: str,
     feedback_dataset_fields: List["AllowedFieldTypes"],
     feedback_dataset_questions: List["AllowedQuestionTypes"],
     feedback_dataset_records: List[FeedbackRecord],
 ) -> None:
-    dataset = FeedbackDataset(
-        guidelines=feedback_dataset_guidelines,
-        fields=feedback_dataset_fields,
-        questions=feedback_dataset_questions,
+    dataset = _build_feedback_dataset(
+        feedback_dataset_guidelines, feedback_dataset_fields, feedback_dataset_questions, feedback_dataset_records
     )
-    dataset.add_records(records=feedback_dataset_records * 2)
-
-    if formatting_func.__name__ == "formatting_func_sentence_transformers_rating_question":
-        label_strategy = RatingQuestionUnification(question=dataset.question_by_name("question-2"), strategy="majority")
-        task = TrainingTask.for_sentence_similarity(formatting_func=formatting_func, label_strategy=label_strategy)
-    else:
-        task = TrainingTask.for_sentence_similarity(formatting_func=formatting_func)
+    task = _build_training_task(dataset, formatting_func)
 
     train_dataset = dataset.prepare_for_training(framework=__FRAMEWORK__, task=task)
 
@@ -104,6 +114,44 @@ def test_prepare_for_training_sentence_transformers(
 
     train_dataset, test_dataset = dataset.prepare_for_training(framework=__FRAMEWORK__, task=task, train_size=0.5)
 
+    assert isinstance(train_dataset, list)
+    assert isinstance(test_dataset, list)
+
+
+# Training is only run once per kind of `InputExample` generated: pairs with integer labels, pairs with float labels,
+# pairs without labels, triplets with labels and triplets without labels.
+@pytest.mark.parametrize("cross_encoder,model_type", [(False, SentenceTransformer), (True, CrossEncoder)])
+@pytest.mark.parametrize(
+    "formatting_func",
+    [
+        formatting_func_sentence_transformers,
+        formatting_func_sentence_transformers_case_1_b,
+        formatting_func_sentence_transformers_case_2,
+        formatting_func_sentence_transformers_case_3_b,
+        formatting_func_sentence_transformers_case_4,
+    ],
+    ids=lambda formatting_func: formatting_func.__name__,
+)
+@pytest.mark.usefixtures(
+    "feedback_dataset_guidelines",
+    "feedback_dataset_fields",
+    "feedback_dataset_questions",
+    "feedback_dataset_records",
+)
+def test_train_sentence_transformers(
+    cross_encoder: bool,
+    model_type: Union[SentenceTransformer, CrossEncoder],
+    formatting_func: Callable,
+    feedback_dataset_guidelines: str,
+    feedback_dataset_fields: List["AllowedFieldTypes"],
+    feedback_dataset_questions: List["AllowedQuestionTypes"],
+    feedback_dataset_records: List[FeedbackRecord],
+) -> None:
+    dataset = _build_feedback_dataset(
+        feedback_dataset_guidelines, feedback_dataset_fields, feedback_dataset_questions, feedback_dataset_records
+    )
+    task = _build_training_task(dataset, formatting_func)
+
     if cross_encoder:
         if ("case_3_b" in formatting_func.__name__) or ("case_4" in formatting_func.__name__):
             with pytest.raises(ValueError, match=r"^Cross-encoders don't support training with triplets"):
@@ -212,13 +260,19 @@ def test_prepare_for_training_sentence_transformers_bad_format(
         )
 
 
+@pytest.fixture(scope="module")
+def snli_small_dataset() -> FeedbackDataset:
+    return FeedbackDataset.from_huggingface("plaguss/snli-small", split="train[:8]")
+
+
 @pytest.mark.parametrize("use_label", [False, True])
 @pytest.mark.parametrize("cross_encoder", [False, True])
 def test_prepare_for_training_sentence_transformers_with_defaults(
     use_label: bool,
     cross_encoder: bool,
+    snli_small_dataset: FeedbackDataset,
 ) -> None:
-    dataset = FeedbackDataset.from_huggingface("plaguss/snli-small", split="train[:8]")
+    dataset = snli_small_dataset
 
     if use_label:
         task = TrainingTask.for_sentence_similarity(